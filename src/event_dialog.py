@@ -17,13 +17,125 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gi.repository import Adw, Gtk, GObject
-from datetime import datetime
+import bisect
+import calendar
+from collections import defaultdict
+from gi.repository import Adw, Gtk, GObject, Gio
+from datetime import date, datetime
+from functools import lru_cache
 from .event_manager import Event, EventManager
 
+# Localized month and weekday names, indexed like datetime.month / weekday()
+_MONTHS = tuple(calendar.month_name)
+_DAYS = tuple(calendar.day_name)
 
+# "Remind Me" options and their offsets in minutes
+_REMINDER_LABELS = (
+    "At time of event",
+    "5 minutes before",
+    "15 minutes before",
+    "30 minutes before",
+    "1 hour before",
+    "1 day before",
+)
+_REMINDER_MINUTES = (0, 5, 15, 30, 60, 1440)
+
+# Sections of the all events list, in display order
+_SECTION_UPCOMING = 0
+_SECTION_PAST = 1
+_SECTION_TITLES = ("Upcoming Events", "Past Events")
+
+# Icons shown on every event row, looked up once and shared
+_ICON_NOTIFY = Gio.ThemedIcon.new("preferences-system-notifications-symbolic")
+_ICON_ARROW = Gio.ThemedIcon.new("go-next-symbolic")
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date string, caching the result."""
+    if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+        raise ValueError(f"invalid date: {date_str!r}")
+    return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+
+
+def _trim(text: str) -> str:
+    """Strip surrounding whitespace, without copying already clean text."""
+    if text and (text[:1].isspace() or text[-1:].isspace()):
+        return text.strip()
+    return text
+
+
+def _new_content_box() -> Gtk.Box:
+    """Create the vertical box holding a list dialog's content."""
+    box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+    box.set_margin_start(12)
+    box.set_margin_end(12)
+    box.set_margin_top(12)
+    box.set_margin_bottom(12)
+    return box
+
+
+@Gtk.Template(resource_path='/com/ml4w/calendar/event_row.ui')
+class EventRow(Adw.ActionRow):
+    """Row showing a single event in the event list dialogs."""
+    __gtype_name__ = 'EventRow'
+    
+    notify_icon = Gtk.Template.Child()
+    edit_btn = Gtk.Template.Child()
+    delete_btn = Gtk.Template.Child()
+    arrow = Gtk.Template.Child()
+    
+    __gsignals__ = {
+        'edit-requested': (GObject.SignalFlags.RUN_FIRST, None, (str,)),
+        'delete-requested': (GObject.SignalFlags.RUN_FIRST, None, (str,)),
+    }
+    
+    def __init__(self, show_delete: bool = False, show_arrow: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        
+        self.event_id = None
+        self.notify_icon.set_from_gicon(_ICON_NOTIFY)
+        self.arrow.set_from_gicon(_ICON_ARROW)
+        self.delete_btn.set_visible(show_delete)
+        self.arrow.set_visible(show_arrow)
+    
+    def bind(self, event: Event, subtitle: str):
+        """Show an event in this row, replacing whatever it showed before."""
+        self.event_id = event.id
+        self.set_title(event.title)
+        self.set_subtitle(subtitle)
+        self.notify_icon.set_visible(event.notify)
+    
+    @Gtk.Template.Callback()
+    def _on_activated(self, row):
+        """Request editing when the row itself is activated."""
+        self.emit('edit-requested', self.event_id)
+    
+    @Gtk.Template.Callback()
+    def _on_edit_clicked(self, button):
+        """Request editing of the shown event."""
+        self.emit('edit-requested', self.event_id)
+    
+    @Gtk.Template.Callback()
+    def _on_delete_clicked(self, button):
+        """Request deletion of the shown event."""
+        self.emit('delete-requested', self.event_id)
+
+
+@Gtk.Template(resource_path='/com/ml4w/calendar/add_event_dialog.ui')
 class AddEventDialog(Adw.Dialog):
     """Dialog for adding or editing an event."""
+    __gtype_name__ = 'AddEventDialog'
+    
+    title_entry = Gtk.Template.Child()
+    description_entry = Gtk.Template.Child()
+    all_day_switch = Gtk.Template.Child()
+    time_row = Gtk.Template.Child()
+    hour_spin = Gtk.Template.Child()
+    minute_spin = Gtk.Template.Child()
+    notify_switch = Gtk.Template.Child()
+    reminder_row = Gtk.Template.Child()
+    delete_group = Gtk.Template.Child()
     
     __gsignals__ = {
         'event-saved': (GObject.SignalFlags.RUN_FIRST, None, (object,)),
@@ -37,10 +149,12 @@ class AddEventDialog(Adw.Dialog):
         self.date_str = date_str
         
         self.set_title("Edit Event" if event else "Add Event")
-        self.set_content_width(400)
-        self.set_content_height(500)
         
-        self._build_ui()
+        self.reminder_combo = self.reminder_row
+        self.reminder_combo.set_model(Gtk.StringList.new(_REMINDER_LABELS))
+        
+        # Delete button only applies when editing
+        self.delete_group.set_visible(event is not None)
         
         # Populate fields if editing
         if event:
@@ -61,160 +175,18 @@ class AddEventDialog(Adw.Dialog):
             
             self.reminder_combo.set_selected(self._get_reminder_index(event.notify_minutes_before))
     
-    def _build_ui(self):
-        """Build the dialog UI."""
-        # Main toolbar view
-        toolbar = Adw.ToolbarView()
-        self.set_child(toolbar)
-        
-        # Header bar
-        header = Adw.HeaderBar()
-        header.set_show_start_title_buttons(False)
-        header.set_show_end_title_buttons(False)
-        
-        # Cancel button
-        cancel_btn = Gtk.Button(label="Cancel")
-        cancel_btn.connect("clicked", lambda _: self.close())
-        header.pack_start(cancel_btn)
-        
-        # Save button
-        save_btn = Gtk.Button(label="Save")
-        save_btn.add_css_class("suggested-action")
-        save_btn.connect("clicked", self._on_save)
-        header.pack_end(save_btn)
-        
-        toolbar.add_top_bar(header)
-        
-        # Content
-        content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        content.set_margin_start(12)
-        content.set_margin_end(12)
-        content.set_margin_top(12)
-        content.set_margin_bottom(12)
-        
-        # Preferences groups
-        # Basic info group
-        basic_group = Adw.PreferencesGroup()
-        basic_group.set_title("Event Details")
-        
-        # Title
-        self.title_entry = Adw.EntryRow()
-        self.title_entry.set_title("Title")
-        basic_group.add(self.title_entry)
-        
-        # Description
-        self.description_entry = Adw.EntryRow()
-        self.description_entry.set_title("Description")
-        basic_group.add(self.description_entry)
-        
-        content.append(basic_group)
-        
-        # Time group
-        time_group = Adw.PreferencesGroup()
-        time_group.set_title("Time")
-        time_group.set_margin_top(24)
-        
-        # All day toggle
-        self.all_day_switch = Adw.SwitchRow()
-        self.all_day_switch.set_title("All Day")
-        self.all_day_switch.set_active(True)
-        self.all_day_switch.connect("notify::active", self._on_all_day_toggled)
-        time_group.add(self.all_day_switch)
-        
-        # Time picker row
-        self.time_row = Adw.ActionRow()
-        self.time_row.set_title("Time")
-        self.time_row.set_sensitive(False)
-        
-        # Hour spinner
-        hour_adj = Gtk.Adjustment(value=12, lower=0, upper=23, step_increment=1)
-        self.hour_spin = Gtk.SpinButton()
-        self.hour_spin.set_adjustment(hour_adj)
-        self.hour_spin.set_numeric(True)
-        self.hour_spin.set_wrap(True)
-        self.hour_spin.set_width_chars(2)
-        self.hour_spin.set_valign(Gtk.Align.CENTER)
-        
-        # Separator label
-        colon_label = Gtk.Label(label=":")
-        colon_label.set_valign(Gtk.Align.CENTER)
-        colon_label.set_margin_start(4)
-        colon_label.set_margin_end(4)
-        
-        # Minute spinner
-        minute_adj = Gtk.Adjustment(value=0, lower=0, upper=59, step_increment=5)
-        self.minute_spin = Gtk.SpinButton()
-        self.minute_spin.set_adjustment(minute_adj)
-        self.minute_spin.set_numeric(True)
-        self.minute_spin.set_wrap(True)
-        self.minute_spin.set_width_chars(2)
-        self.minute_spin.set_valign(Gtk.Align.CENTER)
-        
-        time_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
-        time_box.append(self.hour_spin)
-        time_box.append(colon_label)
-        time_box.append(self.minute_spin)
-        
-        self.time_row.add_suffix(time_box)
-        time_group.add(self.time_row)
-        
-        content.append(time_group)
-        
-        # Notification group
-        notify_group = Adw.PreferencesGroup()
-        notify_group.set_title("Notifications")
-        notify_group.set_margin_top(24)
-        
-        # Enable notifications
-        self.notify_switch = Adw.SwitchRow()
-        self.notify_switch.set_title("Enable Notification")
-        self.notify_switch.set_active(True)
-        self.notify_switch.connect("notify::active", self._on_notify_toggled)
-        notify_group.add(self.notify_switch)
-        
-        # Reminder time
-        self.reminder_row = Adw.ComboRow()
-        self.reminder_row.set_title("Remind Me")
-        
-        reminder_options = Gtk.StringList()
-        reminder_options.append("At time of event")
-        reminder_options.append("5 minutes before")
-        reminder_options.append("15 minutes before")
-        reminder_options.append("30 minutes before")
-        reminder_options.append("1 hour before")
-        reminder_options.append("1 day before")
-        
-        self.reminder_combo = self.reminder_row
-        self.reminder_combo.set_model(reminder_options)
-        self.reminder_combo.set_selected(0)
-        notify_group.add(self.reminder_row)
-        
-        content.append(notify_group)
-        
-        # Delete button for editing
-        if self.editing_event:
-            delete_group = Adw.PreferencesGroup()
-            delete_group.set_margin_top(24)
-            
-            delete_btn = Gtk.Button(label="Delete Event")
-            delete_btn.add_css_class("destructive-action")
-            delete_btn.set_halign(Gtk.Align.CENTER)
-            delete_btn.connect("clicked", self._on_delete)
-            
-            delete_group.add(delete_btn)
-            content.append(delete_group)
-        
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_child(content)
-        
-        toolbar.set_content(scrolled)
+    @Gtk.Template.Callback()
+    def _on_cancel(self, button):
+        """Close without saving."""
+        self.close()
     
+    @Gtk.Template.Callback()
     def _on_all_day_toggled(self, switch, _):
         """Handle all-day toggle."""
         is_all_day = switch.get_active()
         self.time_row.set_sensitive(not is_all_day)
     
+    @Gtk.Template.Callback()
     def _on_notify_toggled(self, switch, _):
         """Handle notification toggle."""
         self.reminder_row.set_sensitive(switch.get_active())
@@ -222,31 +194,21 @@ class AddEventDialog(Adw.Dialog):
     def _get_reminder_minutes(self) -> int:
         """Get reminder minutes from combo selection."""
         selected = self.reminder_combo.get_selected()
-        mapping = {
-            0: 0,       # At time of event
-            1: 5,       # 5 minutes before
-            2: 15,      # 15 minutes before
-            3: 30,      # 30 minutes before
-            4: 60,      # 1 hour before
-            5: 1440,    # 1 day before
-        }
-        return mapping.get(selected, 0)
+        if 0 <= selected < len(_REMINDER_MINUTES):
+            return _REMINDER_MINUTES[selected]
+        return 0
     
     def _get_reminder_index(self, minutes: int) -> int:
         """Get combo index from reminder minutes."""
-        mapping = {
-            0: 0,
-            5: 1,
-            15: 2,
-            30: 3,
-            60: 4,
-            1440: 5,
-        }
-        return mapping.get(minutes, 0)
+        try:
+            return _REMINDER_MINUTES.index(minutes)
+        except ValueError:
+            return 0
     
+    @Gtk.Template.Callback()
     def _on_save(self, button):
         """Save the event."""
-        title = self.title_entry.get_text().strip()
+        title = _trim(self.title_entry.get_text())
         
         if not title:
             # Show error toast
@@ -265,7 +227,7 @@ class AddEventDialog(Adw.Dialog):
         if self.editing_event:
             # Update existing event
             self.editing_event.title = title
-            self.editing_event.description = self.description_entry.get_text().strip()
+            self.editing_event.description = _trim(self.description_entry.get_text())
             self.editing_event.time = time_str
             self.editing_event.notify = self.notify_switch.get_active()
             self.editing_event.notify_minutes_before = self._get_reminder_minutes()
@@ -278,7 +240,7 @@ class AddEventDialog(Adw.Dialog):
                 title=title,
                 date=self.date_str,
                 time=time_str,
-                description=self.description_entry.get_text().strip(),
+                description=_trim(self.description_entry.get_text()),
                 notify=self.notify_switch.get_active(),
                 notify_minutes_before=self._get_reminder_minutes()
             )
@@ -287,6 +249,7 @@ class AddEventDialog(Adw.Dialog):
         
         self.close()
     
+    @Gtk.Template.Callback()
     def _on_delete(self, button):
         """Delete the event."""
         if self.editing_event:
@@ -294,8 +257,13 @@ class AddEventDialog(Adw.Dialog):
         self.close()
 
 
+@Gtk.Template(resource_path='/com/ml4w/calendar/event_list_dialog.ui')
 class EventListDialog(Adw.Dialog):
     """Dialog for viewing events on a specific date."""
+    __gtype_name__ = 'EventListDialog'
+    
+    scrolled = Gtk.Template.Child()
+    status_page = Gtk.Template.Child()
     
     def __init__(self, event_manager: EventManager, date_str: str, **kwargs):
         super().__init__(**kwargs)
@@ -303,308 +271,340 @@ class EventListDialog(Adw.Dialog):
         self.event_manager = event_manager
         self.date_str = date_str
         
+        # Displayed rows, keyed by event ID
+        self._rows = {}
+        self._row_sig = {}
+        self._row_order = []
+        # Detached rows kept around for reuse
+        self._row_pool = []
+        
         # Parse date for display
         try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            date_display = dt.strftime("%B %d, %Y")
+            dt = _parse_ymd(date_str)
+            date_display = f"{_MONTHS[dt.month]} {dt.day:02d}, {dt.year}"
         except ValueError:
             date_display = date_str
         
         self.set_title(f"Events - {date_display}")
-        self.set_content_width(400)
-        self.set_content_height(450)
         
-        self._build_ui()
         self._load_events()
         
         # Register for updates
         self.event_manager.register_callback(self._load_events)
     
-    def _build_ui(self):
-        """Build the dialog UI."""
-        toolbar = Adw.ToolbarView()
-        self.set_child(toolbar)
-        
-        # Header bar
-        header = Adw.HeaderBar()
-        header.set_show_start_title_buttons(False)
-        header.set_show_end_title_buttons(False)
-        
-        # Close button
-        close_btn = Gtk.Button(label="Close")
-        close_btn.connect("clicked", lambda _: self.close())
-        header.pack_start(close_btn)
-        
-        # Add button
-        add_btn = Gtk.Button()
-        add_btn.set_icon_name("list-add-symbolic")
-        add_btn.add_css_class("suggested-action")
-        add_btn.connect("clicked", self._on_add_event)
-        header.pack_end(add_btn)
-        
-        toolbar.add_top_bar(header)
-        
-        # Content
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        
-        self.content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        self.content_box.set_margin_start(12)
-        self.content_box.set_margin_end(12)
-        self.content_box.set_margin_top(12)
-        self.content_box.set_margin_bottom(12)
-        
-        scrolled.set_child(self.content_box)
-        toolbar.set_content(scrolled)
-        
-        # Status page for empty state
-        self.status_page = Adw.StatusPage()
-        self.status_page.set_icon_name("x-office-calendar-symbolic")
-        self.status_page.set_title("No Events")
-        self.status_page.set_description("Tap + to add an event for this day")
-        
-        self.events_group = Adw.PreferencesGroup()
+    @Gtk.Template.Callback()
+    def _on_close(self, button):
+        """Close the dialog."""
+        self.close()
+    
+    @Gtk.Template.Callback()
+    def _on_closed(self, dialog):
+        """Stop refreshing once the dialog is gone."""
+        self.event_manager.unregister_callback(self._load_events)
     
-    def _load_events(self):
-        """Load and display events for the date."""
-        # Clear existing content
-        while True:
-            child = self.content_box.get_first_child()
-            if child is None:
-                break
-            self.content_box.remove(child)
+    def _reset_content_box(self):
+        """Start a new, detached content box to replace the shown one."""
+        # The status page is reused across refreshes, detach it first
+        parent = self.status_page.get_parent()
+        if parent is not None:
+            parent.remove(self.status_page)
+        self.content_box = _new_content_box()
+    
+    def _show_content_box(self):
+        """Swap the filled content box in, dropping the old one."""
+        # Rows were added while detached, so styles resolve once here
+        self.scrolled.set_child(self.content_box)
+    
+    def _load_events(self, changed: Event = None):
+        """Load and display events for the date, updating rows in place."""
+        # Changes to other dates do not affect this list, unless an event
+        # shown here was moved away
+        if (changed is not None and changed.date != self.date_str
+                and changed.id not in self._rows):
+            return
         
         events = self.event_manager.get_events_for_date(self.date_str)
         
         if not events:
+            self._reset_content_box()
+            self._rows.clear()
+            self._row_sig.clear()
+            self._row_order = []
             self.content_box.append(self.status_page)
-        else:
-            # Sort events by time
-            events.sort(key=lambda e: (e.time == "", e.time))
-            
-            events_group = Adw.PreferencesGroup()
+            self._show_content_box()
+            return
+        
+        order = [e.id for e in events]
+        new_ids = set(order)
+        kept = [event_id for event_id in self._row_order if event_id in new_ids]
+        
+        # Rows can only be appended to a group, so rebuild when surviving
+        # rows would move or new ones would land in the middle
+        if not self._rows or order[:len(kept)] != kept:
+            self._rebuild_rows(events)
+            return
+        
+        with self.events_group.freeze_notify():
+            for event_id in self._row_order:
+                if event_id not in new_ids:
+                    row = self._rows.pop(event_id)
+                    del self._row_sig[event_id]
+                    self.events_group.remove(row)
+                    self._row_pool.append(row)
             
             for event in events:
-                row = Adw.ActionRow()
-                row.set_title(event.title)
-                
-                subtitle = event.get_display_time()
-                if event.description:
-                    subtitle += f" • {event.description}"
-                row.set_subtitle(subtitle)
-                
-                # Notification indicator
-                if event.notify:
-                    notify_icon = Gtk.Image.new_from_icon_name("preferences-system-notifications-symbolic")
-                    notify_icon.set_opacity(0.5)
-                    row.add_prefix(notify_icon)
-                
-                # Edit button
-                edit_btn = Gtk.Button()
-                edit_btn.set_icon_name("document-edit-symbolic")
-                edit_btn.set_valign(Gtk.Align.CENTER)
-                edit_btn.add_css_class("flat")
-                edit_btn.connect("clicked", self._on_edit_event, event)
-                row.add_suffix(edit_btn)
-                
-                # Arrow
-                arrow = Gtk.Image.new_from_icon_name("go-next-symbolic")
-                row.add_suffix(arrow)
-                row.set_activatable(True)
-                row.connect("activated", self._on_edit_event, event)
-                
-                events_group.add(row)
-            
-            self.content_box.append(events_group)
+                sig = self._row_signature(event)
+                if event.id not in self._rows:
+                    self._add_row(event, sig)
+                elif sig != self._row_sig[event.id]:
+                    self._rows[event.id].bind(event, sig[1])
+                    self._row_sig[event.id] = sig
+        
+        self._row_order = order
+    
+    def _rebuild_rows(self, events):
+        """Drop all rows and build them again from a sorted event list."""
+        self._reset_content_box()
+        self._rows.clear()
+        self._row_sig.clear()
+        
+        self.events_group = Adw.PreferencesGroup()
+        with self.events_group.freeze_notify():
+            for event in events:
+                self._add_row(event, self._row_signature(event))
+        self._row_order = [e.id for e in events]
+        
+        self.content_box.append(self.events_group)
+        self._show_content_box()
     
+    def _row_signature(self, event):
+        """Get the (title, subtitle, notify) tuple shown by an event's row."""
+        if event.description:
+            subtitle = f"{event.get_display_time()} • {event.description}"
+        else:
+            subtitle = event.get_display_time()
+        return (event.title, subtitle, event.notify)
+    
+    def _add_row(self, event, sig):
+        """Append a row for an event to the events group, reusing a pooled one."""
+        if self._row_pool:
+            row = self._row_pool.pop()
+        else:
+            row = EventRow(show_arrow=True)
+            row.connect('edit-requested', self._on_edit_event)
+        row.bind(event, sig[1])
+        
+        self.events_group.add(row)
+        self._rows[event.id] = row
+        self._row_sig[event.id] = sig
+    
+    @Gtk.Template.Callback()
     def _on_add_event(self, button):
         """Show add event dialog."""
         dialog = AddEventDialog(self.event_manager, self.date_str)
-        dialog.connect('event-saved', lambda d, e: self._load_events())
+        dialog.connect('event-saved', self._on_event_saved)
         dialog.present(self)
     
-    def _on_edit_event(self, widget, event):
+    def _on_edit_event(self, row, event_id):
         """Show edit event dialog."""
+        # Rows outlive edits, so resolve the current event by ID
+        event = self.event_manager.get_event_by_id(event_id)
+        if event is None:
+            return
         dialog = AddEventDialog(self.event_manager, self.date_str, event=event)
-        dialog.connect('event-saved', lambda d, e: self._load_events())
+        dialog.connect('event-saved', self._on_event_saved)
         dialog.present(self)
+    
+    def _on_event_saved(self, dialog, event):
+        """Refresh after an add/edit dialog saved an event."""
+        self._load_events(event)
+
+
+class EventItem(GObject.Object):
+    """List model item pairing an event with the row text it is shown with."""
+    __gtype_name__ = 'EventItem'
+    
+    def __init__(self, event: Event, subtitle: str, section: int):
+        super().__init__()
+        self.event = event
+        self.subtitle = subtitle
+        self.section = section
 
 
+@Gtk.Template(resource_path='/com/ml4w/calendar/all_events_dialog.ui')
 class AllEventsDialog(Adw.Dialog):
     """Dialog for viewing all events."""
+    __gtype_name__ = 'AllEventsDialog'
+    
+    stack = Gtk.Template.Child()
+    status_page = Gtk.Template.Child()
+    scrolled = Gtk.Template.Child()
+    list_view = Gtk.Template.Child()
     
     def __init__(self, event_manager: EventManager, **kwargs):
         super().__init__(**kwargs)
         
         self.event_manager = event_manager
+        # EventManager revision currently on screen
+        self._revision = None
+        
+        # Items are stored in display order; the section sorter only
+        # tells the list where the upcoming/past headers go
+        self.store = Gio.ListStore(item_type=EventItem)
+        sections = Gtk.SortListModel(model=self.store)
+        sections.set_section_sorter(Gtk.CustomSorter.new(self._compare_sections, None))
+        self.list_view.set_model(Gtk.NoSelection(model=sections))
+        
+        # Only rows on screen exist; they are rebound while scrolling
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_row_setup)
+        factory.connect("bind", self._on_row_bind)
+        self.list_view.set_factory(factory)
+        
+        header_factory = Gtk.SignalListItemFactory()
+        header_factory.connect("setup", self._on_header_setup)
+        header_factory.connect("bind", self._on_header_bind)
+        self.list_view.set_header_factory(header_factory)
         
-        self.set_title("All Events")
-        self.set_content_width(450)
-        self.set_content_height(550)
-        
-        self._build_ui()
         self._load_events()
         
         # Register for updates
         self.event_manager.register_callback(self._load_events)
     
-    def _build_ui(self):
-        """Build the dialog UI."""
-        toolbar = Adw.ToolbarView()
-        self.set_child(toolbar)
-        
-        # Header bar
-        header = Adw.HeaderBar()
-        header.set_show_start_title_buttons(False)
-        header.set_show_end_title_buttons(False)
-        
-        # Close button
-        close_btn = Gtk.Button(label="Close")
-        close_btn.connect("clicked", lambda _: self.close())
-        header.pack_start(close_btn)
-        
-        toolbar.add_top_bar(header)
-        
-        # Content
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        
-        self.content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        self.content_box.set_margin_start(12)
-        self.content_box.set_margin_end(12)
-        self.content_box.set_margin_top(12)
-        self.content_box.set_margin_bottom(12)
-        
-        scrolled.set_child(self.content_box)
-        toolbar.set_content(scrolled)
-        
-        # Status page for empty state
-        self.status_page = Adw.StatusPage()
-        self.status_page.set_icon_name("x-office-calendar-symbolic")
-        self.status_page.set_title("No Events")
-        self.status_page.set_description("Add events by selecting a date on the calendar")
+    @Gtk.Template.Callback()
+    def _on_close(self, button):
+        """Close the dialog."""
+        self.close()
+    
+    @Gtk.Template.Callback()
+    def _on_closed(self, dialog):
+        """Stop refreshing once the dialog is gone."""
+        self.event_manager.unregister_callback(self._load_events)
+    
+    @staticmethod
+    def _compare_sections(a, b, *_):
+        """Order items by section only, keeping the store order within one."""
+        return (a.section > b.section) - (a.section < b.section)
+    
+    def _on_row_setup(self, factory, list_item):
+        """Create a reusable row for the list view."""
+        row = EventRow(show_delete=True)
+        row.connect('edit-requested', self._on_edit_event)
+        row.connect('delete-requested', self._on_delete_event)
+        list_item.set_child(row)
+    
+    def _on_row_bind(self, factory, list_item):
+        """Show a list item's event on its row."""
+        item = list_item.get_item()
+        list_item.get_child().bind(item.event, item.subtitle)
+    
+    def _on_header_setup(self, factory, header):
+        """Create a section header label."""
+        label = Gtk.Label(xalign=0)
+        label.add_css_class("heading")
+        label.set_margin_top(12)
+        label.set_margin_bottom(6)
+        label.set_margin_start(12)
+        header.set_child(label)
+    
+    def _on_header_bind(self, factory, header):
+        """Title a section header from its first item."""
+        header.get_child().set_label(_SECTION_TITLES[header.get_item().section])
     
-    def _load_events(self):
+    @Gtk.Template.Callback()
+    def _on_row_activate(self, list_view, position):
+        """Edit the event of an activated row."""
+        item = list_view.get_model().get_item(position)
+        self._on_edit_event(None, item.event.id)
+    
+    def _load_events(self, changed: Event = None):
         """Load and display all events grouped by date."""
-        # Clear existing content
-        while True:
-            child = self.content_box.get_first_child()
-            if child is None:
-                break
-            self.content_box.remove(child)
+        # Saving from an edit dialog reports the same change twice
+        if self.event_manager.revision == self._revision:
+            return
+        self._revision = self.event_manager.revision
         
+        # Already sorted by date and time
         events = self.event_manager.events
         
         if not events:
-            self.content_box.append(self.status_page)
+            self.store.remove_all()
+            self.stack.set_visible_child(self.status_page)
             return
         
-        # Group events by date
-        events_by_date = {}
+        # Group events by date, as YYYYMMDD ints
+        events_by_date = defaultdict(list)
         for event in events:
-            if event.date not in events_by_date:
-                events_by_date[event.date] = []
-            events_by_date[event.date].append(event)
+            events_by_date[event.date_int].append(event)
         
-        # Sort dates
-        sorted_dates = sorted(events_by_date.keys())
+        # Events are kept sorted by date, so this is a linear pass
+        sorted_dates = sorted(events_by_date)
         
-        today = datetime.now().strftime("%Y-%m-%d")
+        now = date.today()
+        today = now.year * 10000 + now.month * 100 + now.day
         
         # Separate past and upcoming events
-        upcoming_dates = [d for d in sorted_dates if d >= today]
-        past_dates = [d for d in sorted_dates if d < today]
+        split = bisect.bisect_left(sorted_dates, today)
+        past_dates = sorted_dates[:split]
+        upcoming_dates = sorted_dates[split:]
+        
+        items = []
         
         # Show upcoming events first
-        if upcoming_dates:
-            upcoming_group = Adw.PreferencesGroup()
-            upcoming_group.set_title("Upcoming Events")
-            
-            for date_str in upcoming_dates:
-                self._add_date_events(upcoming_group, date_str, events_by_date[date_str], today)
-            
-            self.content_box.append(upcoming_group)
+        for date_int in upcoming_dates:
+            self._add_date_events(items, _SECTION_UPCOMING, date_int, events_by_date[date_int], today)
         
         # Show past events
-        if past_dates:
-            past_group = Adw.PreferencesGroup()
-            past_group.set_title("Past Events")
-            past_group.set_margin_top(12)
-            
-            for date_str in reversed(past_dates):  # Most recent first
-                self._add_date_events(past_group, date_str, events_by_date[date_str], today)
-            
-            self.content_box.append(past_group)
+        for date_int in reversed(past_dates):  # Most recent first
+            self._add_date_events(items, _SECTION_PAST, date_int, events_by_date[date_int], today)
         
-        if not upcoming_dates and not past_dates:
-            self.content_box.append(self.status_page)
+        # Swap the whole model contents in one change notification
+        self.store.splice(0, self.store.get_n_items(), items)
+        self.stack.set_visible_child(self.scrolled)
     
-    def _add_date_events(self, group, date_str, events, today):
-        """Add events for a specific date to the group."""
+    def _add_date_events(self, items, section, date_int, events, today):
+        """Add list items for the events of a specific date."""
         # Format the date
+        year, month_day = divmod(date_int, 10000)
+        month, day = divmod(month_day, 100)
         try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            if date_str == today:
+            if date_int == today:
                 date_display = "Today"
             else:
-                date_display = dt.strftime("%A, %B %d")
+                weekday = date(year, month, day).weekday()
+                date_display = f"{_DAYS[weekday]}, {_MONTHS[month]} {day:02d}"
         except ValueError:
-            date_display = date_str
-        
-        # Sort events by time
-        events.sort(key=lambda e: (e.time == "", e.time))
+            date_display = events[0].date
         
         for i, event in enumerate(events):
-            row = Adw.ActionRow()
-            row.set_title(event.title)
-            
             # Build subtitle with date (for first event of each date) and time
+            parts = []
             if i == 0:
-                subtitle = f"📅 {date_display}"
+                parts.append(f"📅 {date_display}")
                 if event.time:
-                    subtitle += f" • {event.get_display_time()}"
+                    parts.append(event.get_display_time())
             else:
-                subtitle = event.get_display_time()
+                parts.append(event.get_display_time())
             
             if event.description:
-                subtitle += f" • {event.description}"
-            
-            row.set_subtitle(subtitle)
+                parts.append(event.description)
             
-            # Notification indicator
-            if event.notify:
-                notify_icon = Gtk.Image.new_from_icon_name("preferences-system-notifications-symbolic")
-                notify_icon.set_opacity(0.5)
-                row.add_prefix(notify_icon)
-            
-            # Edit button
-            edit_btn = Gtk.Button()
-            edit_btn.set_icon_name("document-edit-symbolic")
-            edit_btn.set_valign(Gtk.Align.CENTER)
-            edit_btn.add_css_class("flat")
-            edit_btn.connect("clicked", self._on_edit_event, event)
-            row.add_suffix(edit_btn)
-            
-            # Delete button
-            delete_btn = Gtk.Button()
-            delete_btn.set_icon_name("user-trash-symbolic")
-            delete_btn.set_valign(Gtk.Align.CENTER)
-            delete_btn.add_css_class("flat")
-            delete_btn.connect("clicked", self._on_delete_event, event)
-            row.add_suffix(delete_btn)
-            
-            row.set_activatable(True)
-            row.connect("activated", self._on_edit_event, event)
-            
-            group.add(row)
+            items.append(EventItem(event, " • ".join(parts), section))
     
-    def _on_edit_event(self, widget, event):
+    def _on_edit_event(self, row, event_id):
         """Show edit event dialog."""
+        event = self.event_manager.get_event_by_id(event_id)
+        if event is None:
+            return
         dialog = AddEventDialog(self.event_manager, event.date, event=event)
-        dialog.connect('event-saved', lambda d, e: self._load_events())
+        dialog.connect('event-saved', self._on_event_saved)
         dialog.present(self)
     
-    def _on_delete_event(self, button, event):
+    def _on_event_saved(self, dialog, event):
+        """Refresh after an add/edit dialog saved an event."""
+        self._load_events(event)
+    
+    def _on_delete_event(self, row, event_id):
         """Delete an event."""
-        self.event_manager.remove_event(event.id)
+        self.event_manager.remove_event(event_id)
         self._load_events()
@@ -19,14 +19,101 @@
 
 import os
 import json
+import logging
+import atexit
 import uuid
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import bisect
+import heapq
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from operator import attrgetter
+from typing import List, Dict, KeysView, Optional, Set, Tuple
 from gi.repository import GLib, Gio
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Storage locations, resolved once per process
+_CONFIG_FOLDER = os.path.join(os.path.expanduser('~'), ".config", "com.ml4w.calendar")
+# Events are stored as MessagePack when available, JSON otherwise
+_JSON_EVENTS_FILE = os.path.join(_CONFIG_FOLDER, "events.json")
+if msgpack is not None:
+    _EVENTS_FILE = os.path.join(_CONFIG_FOLDER, "events.msgpack")
+else:
+    _EVENTS_FILE = _JSON_EVENTS_FILE
+# Changes since the last snapshot, one JSON record per line
+_LOG_FILE = os.path.join(_CONFIG_FOLDER, "events.log")
+
+# Set once _CONFIG_FOLDER is known to exist
+_dir_ready = False
+
+# How long changes may stay in memory before they are written
+_SAVE_DELAY_SECONDS = 10
+
+# How long after its start an event is still worth a reminder
+_ONE_HOUR = timedelta(hours=1)
+
+# Longest sleep between notification checks. Wakeups are normally timed
+# to the next due reminder, but the timer clock stops during suspend.
+_MAX_CHECK_SECONDS = 15 * 60
+
+# The change log is folded into the snapshot once it is twice the
+# snapshot's size, but never for logs smaller than this
+_LOG_COMPACT_MIN_BYTES = 64 * 1024
+
+# Errors raised for a corrupt events file
+if msgpack is not None:
+    _DECODE_ERRORS = (ValueError, msgpack.UnpackException)
+else:
+    _DECODE_ERRORS = (ValueError,)
+
+# JSON encoding for the change log and the JSON events file: UTF-8 bytes
+# in and out, using orjson when it is installed
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
+
+# Key used to keep EventManager.events ordered by date, then time
+_SORT_KEY = attrgetter("_sort_key")
+
+
+def _pack_date(date_str: str) -> int:
+    """Pack a YYYY-MM-DD string into a YYYYMMDD int, or -1 if malformed."""
+    try:
+        return int(date_str[0:4]) * 10000 + int(date_str[5:7]) * 100 + int(date_str[8:10])
+    except ValueError:
+        return -1
+
+
+# Marks a cached Event value that has not been computed yet
+_UNSET = object()
+
+
 class Event:
     """Represents a calendar event or reminder."""
     
+    # Stored fields, then values derived from them and cached
+    __slots__ = (
+        "id", "title", "_date", "_time", "description", "notify",
+        "_notify_minutes_before", "notified",
+        "date_int", "day", "_sort_key", "_display_time", "_dt",
+        "_notify_time", "_notify_ts", "_event_end", "_event_end_ts",
+    )
+    
     def __init__(self, title: str, date: str, time: str = "", 
                  description: str = "", notify: bool = True, 
                  notify_minutes_before: int = 0, event_id: str = None):
@@ -38,6 +125,52 @@ class Event:
         self.notify = notify
         self.notify_minutes_before = notify_minutes_before
         self.notified = False
+        # Set by EventManager when the event is stored
+        self._sort_key = None
+    
+    @property
+    def date(self) -> str:
+        return self._date
+    
+    @date.setter
+    def date(self, value: str):
+        self._date = value
+        # Same ordering as the string, but compares as a plain int
+        self.date_int = _pack_date(value)
+        # Parsed once here; None if malformed
+        try:
+            self.day = date.fromisoformat(value)
+        except (TypeError, ValueError):
+            self.day = None
+        self._dt = _UNSET
+        self._notify_time = _UNSET
+        self._notify_ts = _UNSET
+        self._event_end = _UNSET
+        self._event_end_ts = _UNSET
+    
+    @property
+    def time(self) -> str:
+        return self._time
+    
+    @time.setter
+    def time(self, value: str):
+        self._time = value
+        self._display_time = None
+        self._dt = _UNSET
+        self._notify_time = _UNSET
+        self._notify_ts = _UNSET
+        self._event_end = _UNSET
+        self._event_end_ts = _UNSET
+    
+    @property
+    def notify_minutes_before(self) -> int:
+        return self._notify_minutes_before
+    
+    @notify_minutes_before.setter
+    def notify_minutes_before(self, value: int):
+        self._notify_minutes_before = value
+        self._notify_time = _UNSET
+        self._notify_ts = _UNSET
     
     def to_dict(self) -> Dict:
         return {
@@ -67,16 +200,62 @@ class Event:
     
     def get_datetime(self) -> Optional[datetime]:
         """Get the datetime of this event."""
-        try:
-            if self.time:
-                return datetime.strptime(f"{self.date} {self.time}", "%Y-%m-%d %H:%M")
+        if self._dt is _UNSET:
+            self._dt = self._parse_datetime()
+        return self._dt
+    
+    def get_notify_time(self) -> Optional[datetime]:
+        """Get when the notification for this event is due."""
+        if self._notify_time is _UNSET:
+            event_dt = self.get_datetime()
+            if event_dt is None:
+                self._notify_time = None
             else:
-                return datetime.strptime(self.date, "%Y-%m-%d")
+                self._notify_time = event_dt - timedelta(minutes=self.notify_minutes_before)
+        return self._notify_time
+    
+    def get_event_end(self) -> Optional[datetime]:
+        """Get the time after which a reminder for this event is no longer sent."""
+        if self._event_end is _UNSET:
+            event_dt = self.get_datetime()
+            self._event_end = None if event_dt is None else event_dt + _ONE_HOUR
+        return self._event_end
+    
+    def get_notify_timestamp(self) -> Optional[float]:
+        """Get get_notify_time() as epoch seconds."""
+        if self._notify_ts is _UNSET:
+            notify_time = self.get_notify_time()
+            self._notify_ts = None if notify_time is None else notify_time.timestamp()
+        return self._notify_ts
+    
+    def get_event_end_timestamp(self) -> Optional[float]:
+        """Get get_event_end() as epoch seconds."""
+        if self._event_end_ts is _UNSET:
+            event_end = self.get_event_end()
+            self._event_end_ts = None if event_end is None else event_end.timestamp()
+        return self._event_end_ts
+    
+    def _parse_datetime(self) -> Optional[datetime]:
+        """Parse date and time, cached by get_datetime()."""
+        day = self.day
+        if day is None:
+            return None
+        if not self.time:
+            return datetime(day.year, day.month, day.day)
+        try:
+            hour, minute = self.time.split(":")
+            return datetime(day.year, day.month, day.day, int(hour), int(minute))
         except ValueError:
             return None
     
     def get_display_time(self) -> str:
         """Get a formatted time string for display."""
+        if self._display_time is None:
+            self._display_time = self._format_time()
+        return self._display_time
+    
+    def _format_time(self) -> str:
+        """Format the event time, cached by get_display_time()."""
         if self.time:
             try:
                 dt = datetime.strptime(self.time, "%H:%M")
@@ -90,134 +269,449 @@ class EventManager:
     """Manages calendar events with persistence and notifications."""
     
     def __init__(self):
-        self.home_folder = os.path.expanduser('~')
-        self.config_folder = os.path.join(self.home_folder, ".config", "com.ml4w.calendar")
-        self.events_file = os.path.join(self.config_folder, "events.json")
-        self.events: List[Event] = []
+        self.config_folder = _CONFIG_FOLDER
+        self.json_events_file = _JSON_EVENTS_FILE
+        self.events_file = _EVENTS_FILE
+        self.log_file = _LOG_FILE
+        self._snapshot_size = 0
+        self._log_size = 0
+        # Read on first access, see _ensure_loaded()
+        self._events: List[Event] = []
+        self._loaded = False
+        # Lookup indexes over self.events, see _index_event()
+        self._by_date: Dict[str, List[Event]] = defaultdict(list)
+        self._by_month: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+        self._by_id: Dict[str, Event] = {}
+        # Min-heap of (notify timestamp, event ID) for unsent reminders
+        self._pending: List[Tuple[float, str]] = []
+        # IDs of notified events, reset once their date has passed
+        self._notified_ids: Set[str] = set()
+        self._last_tick_date = None
         self._notification_timeout_id = None
         self._callbacks = []
+        # Callbacks run from an idle handler, see _notify_callbacks()
+        self._changed_events: List[Optional[Event]] = []
+        self._cb_pending = False
+        # Snapshot writes are batched; see _schedule_save()
+        self._dirty = False
+        self._save_timeout_id = None
+        # Bumped on every change so views can skip redundant refreshes
+        self.revision = 0
         
         # Ensure config directory exists
-        os.makedirs(self.config_folder, exist_ok=True)
+        global _dir_ready
+        if not _dir_ready:
+            os.makedirs(self.config_folder, exist_ok=True)
+            _dir_ready = True
         
-        # Load existing events
-        self.load_events()
-        
-        # Start notification checker
+        # Start notification checker; its first check runs once the window
+        # is up and loads the events, unless something needed them earlier
         self._start_notification_checker()
+        
+        # Make sure batched changes reach the disk on exit
+        atexit.register(self._flush)
+    
+    @property
+    def events(self) -> List[Event]:
+        """All events, sorted by date and time."""
+        self._ensure_loaded()
+        return self._events
+    
+    def _ensure_loaded(self):
+        """Load the events unless that already happened."""
+        if not self._loaded:
+            self.load_events()
     
     def load_events(self):
-        """Load events from the JSON file."""
+        """Load events from the events file, falling back to legacy JSON."""
+        self._loaded = True
+        self._events = []
+        self._by_date.clear()
+        self._by_month.clear()
+        self._by_id.clear()
+        self._pending = []
+        self._notified_ids.clear()
+        
+        # Event dicts by ID: the snapshot, then the change log replayed on top
+        records = {}
+        self._snapshot_size = 0
+        
         if os.path.exists(self.events_file):
-            try:
-                with open(self.events_file, 'r') as f:
-                    data = json.load(f)
-                    self.events = [Event.from_dict(e) for e in data.get("events", [])]
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading events: {e}")
-                self.events = []
+            path = self.events_file
+        elif os.path.exists(self.json_events_file):
+            path = self.json_events_file
         else:
-            self.events = []
+            path = None
+        
+        if path is not None:
+            try:
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                if path == self.json_events_file:
+                    data = _json_loads(raw)
+                else:
+                    data = msgpack.unpackb(raw, raw=False)
+                for e in data.get("events", []):
+                    records[e.get("id") or str(uuid.uuid4())] = e
+                self._snapshot_size = len(raw)
+            except (IOError, *_DECODE_ERRORS) as e:
+                logger.error("Error loading events: %s", e)
+                records = {}
+        
+        self._replay_log(records)
+        events = [Event.from_dict(dict(e, id=event_id)) for event_id, e in records.items()]
+        
+        for event in events:
+            event._sort_key = self._make_sort_key(event)
+        events.sort(key=_SORT_KEY)
+        self._events = events
+        # Sorted input keeps the per-date lists sorted too
+        for event in events:
+            self._index_event(event)
+        
+        for event in events:
+            if event.notified:
+                self._notified_ids.add(event.id)
+                continue
+            entry = self._pending_entry(event)
+            if entry is not None:
+                self._pending.append(entry)
+        heapq.heapify(self._pending)
+    
+    def _replay_log(self, records: Dict[str, Dict]):
+        """Apply the changes recorded in the change log to event dicts."""
+        self._log_size = 0
+        try:
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _json_loads(line)
+                        op = record["op"]
+                        data = record["event"]
+                        event_id = data["id"]
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Torn write at the end of the log
+                    if op == "remove":
+                        records.pop(event_id, None)
+                    else:
+                        records[event_id] = data
+                self._log_size = f.tell()
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            logger.error("Error reading event log: %s", e)
+    
+    def _log_change(self, op: str, event: Event):
+        """Persist a single add/update/remove by appending it to the change log."""
+        line = _json_dumps({"op": op, "event": event.to_dict()}) + b"\n"
+        try:
+            fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                self._log_size += os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.error("Error writing event log: %s", e)
+            self._schedule_save()  # Fall back to a full save
+            return
+        
+        # Fold the log into a fresh snapshot once it outgrows it
+        if self._log_size > 2 * max(self._snapshot_size, _LOG_COMPACT_MIN_BYTES):
+            self._schedule_save()
     
     def save_events(self):
-        """Save events to the JSON file."""
+        """Save all events as a new snapshot and clear the change log."""
+        data = {"events": [e.to_dict() for e in self.events]}
+        if msgpack is not None:
+            raw = msgpack.packb(data, use_bin_type=True)
+        else:
+            raw = _json_dumps(data)
+        
+        # Write a temporary file and rename it over the old one, so a crash
+        # mid-write never leaves a truncated calendar behind
+        tmp_file = self.events_file + ".tmp"
         try:
-            with open(self.events_file, 'w') as f:
-                data = {"events": [e.to_dict() for e in self.events]}
-                json.dump(data, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.events_file)
+            
+            # Persist the rename itself
+            dir_fd = os.open(self.config_folder, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except IOError as e:
+            logger.error("Error saving events: %s", e)
+            return
+        self._snapshot_size = len(raw)
+        
+        # Everything logged so far is in the snapshot now; replaying the
+        # log again after a crash right here would be harmless
+        try:
+            os.remove(self.log_file)
+        except FileNotFoundError:
+            pass
         except IOError as e:
-            print(f"Error saving events: {e}")
+            logger.error("Error clearing event log: %s", e)
+        self._log_size = 0
+    
+    def _schedule_save(self):
+        """Mark events as changed and save them within the next few seconds."""
+        self._dirty = True
+        if self._save_timeout_id is None:
+            self._save_timeout_id = GLib.timeout_add_seconds(_SAVE_DELAY_SECONDS, self._flush)
+    
+    def _flush(self) -> bool:
+        """Write pending changes to disk, if there are any."""
+        self._save_timeout_id = None
+        if self._dirty:
+            self._dirty = False
+            self.save_events()
+        return False  # One-shot timeout
+    
+    @staticmethod
+    def _make_sort_key(event: Event) -> tuple:
+        """Get the ordering key of an event: date, then timed before all-day."""
+        return (event.date, event.time == "", event.time)
+    
+    def _insert_sorted(self, event: Event):
+        """Insert an event into self.events and the indexes, keeping them sorted."""
+        event._sort_key = self._make_sort_key(event)
+        bisect.insort(self._events, event, key=_SORT_KEY)
+        bisect.insort(self._by_date[event._sort_key[0]], event, key=_SORT_KEY)
+        self._by_id[event.id] = event
+        self._index_day(event._sort_key[0])
+    
+    def _index_event(self, event: Event):
+        """Append an event to the indexes; callers keep the order."""
+        self._by_date[event._sort_key[0]].append(event)
+        self._by_id[event.id] = event
+        self._index_day(event._sort_key[0])
+    
+    def _index_day(self, date_str: str):
+        """Record that a date has events in the month index."""
+        date_int = _pack_date(date_str)
+        if date_int >= 0:
+            year_month, day = divmod(date_int, 100)
+            self._by_month[divmod(year_month, 100)].add(day)
+    
+    @staticmethod
+    def _remove_sorted(events: List[Event], event: Event):
+        """Remove an event from a sorted list, found by the key it was stored with."""
+        i = bisect.bisect_left(events, event._sort_key, key=_SORT_KEY)
+        while i < len(events) and events[i]._sort_key == event._sort_key:
+            if events[i].id == event.id:
+                del events[i]
+                return
+            i += 1
+    
+    def _unindex_event(self, event: Event):
+        """Drop an event from self.events and the indexes, under the date it was stored with."""
+        self._by_id.pop(event.id, None)
+        self._remove_sorted(self._events, event)
+        date_str = event._sort_key[0]
+        day_events = self._by_date[date_str]
+        self._remove_sorted(day_events, event)
+        if day_events:
+            return
+        
+        # Last event of the day, so the date leaves the indexes
+        del self._by_date[date_str]
+        date_int = _pack_date(date_str)
+        if date_int >= 0:
+            year_month, day = divmod(date_int, 100)
+            month_key = divmod(year_month, 100)
+            days = self._by_month[month_key]
+            days.discard(day)
+            if not days:
+                del self._by_month[month_key]
     
     def add_event(self, event: Event) -> bool:
         """Add a new event."""
-        self.events.append(event)
-        self.save_events()
-        self._notify_callbacks()
+        self._ensure_loaded()
+        self._insert_sorted(event)
+        self._push_pending(event)
+        self._log_change("add", event)
+        self._notify_callbacks(event)
         return True
     
     def update_event(self, event: Event) -> bool:
         """Update an existing event."""
-        for i, e in enumerate(self.events):
-            if e.id == event.id:
-                self.events[i] = event
-                self.save_events()
-                self._notify_callbacks()
-                return True
-        return False
+        self._ensure_loaded()
+        old = self._by_id.get(event.id)
+        if old is None:
+            return False
+        
+        # Date or time may have changed, so re-insert in order
+        self._unindex_event(old)
+        self._insert_sorted(event)
+        self._push_pending(event)
+        self._log_change("update", event)
+        self._notify_callbacks(event)
+        return True
     
     def remove_event(self, event_id: str) -> bool:
         """Remove an event by ID."""
-        for i, e in enumerate(self.events):
-            if e.id == event_id:
-                del self.events[i]
-                self.save_events()
-                self._notify_callbacks()
-                return True
-        return False
+        self._ensure_loaded()
+        event = self._by_id.get(event_id)
+        if event is None:
+            return False
+        
+        self._unindex_event(event)
+        self._log_change("remove", event)
+        self._notify_callbacks(event)
+        return True
     
     def get_events_for_date(self, date_str: str) -> List[Event]:
-        """Get all events for a specific date (YYYY-MM-DD format)."""
-        return [e for e in self.events if e.date == date_str]
+        """Get all events for a specific date (YYYY-MM-DD format), sorted by time."""
+        self._ensure_loaded()
+        day_events = self._by_date.get(date_str)
+        return list(day_events) if day_events else []
     
-    def get_dates_with_events(self) -> set:
-        """Get a set of all dates that have events."""
-        return {e.date for e in self.events}
+    def get_dates_with_events(self) -> KeysView[str]:
+        """Get a live view of all dates (YYYY-MM-DD) that have events."""
+        self._ensure_loaded()
+        return self._by_date.keys()
+    
+    def get_days_for_month(self, year: int, month: int) -> Set[int]:
+        """Get the days of a month (1-12) that have events."""
+        self._ensure_loaded()
+        return self._by_month.get((year, month), set())
     
     def get_event_by_id(self, event_id: str) -> Optional[Event]:
         """Get a specific event by ID."""
-        for e in self.events:
-            if e.id == event_id:
-                return e
-        return None
+        self._ensure_loaded()
+        return self._by_id.get(event_id)
     
     def register_callback(self, callback):
-        """Register a callback to be called when events change."""
+        """Register a callback to be called when events change.
+        
+        The callback receives the added, updated or removed Event, or None
+        when the change is not tied to a single event. Bursts of changes
+        are coalesced into one call.
+        """
         self._callbacks.append(callback)
     
-    def _notify_callbacks(self):
-        """Notify all registered callbacks."""
-        for callback in self._callbacks:
+    def unregister_callback(self, callback):
+        """Stop calling a previously registered callback."""
+        try:
+            self._callbacks.remove(callback)
+        except ValueError:
+            pass
+    
+    def _notify_callbacks(self, event: Optional[Event] = None):
+        """Notify all registered callbacks once the main loop is idle.
+        
+        Changes made in the meantime are reported by a single call.
+        """
+        self.revision += 1
+        self._changed_events.append(event)
+        if self._cb_pending:
+            return
+        self._cb_pending = True
+        GLib.idle_add(self._run_callbacks_once)
+    
+    def _run_callbacks_once(self) -> bool:
+        """Call all registered callbacks for the changes made since the last run."""
+        self._cb_pending = False
+        changed, self._changed_events = self._changed_events, []
+        
+        # Only pass an event on if it is the only one that changed
+        event = changed[0]
+        if event is not None and any(e is None or e.id != event.id for e in changed):
+            event = None
+        
+        # Callbacks may unregister themselves while we iterate
+        for callback in list(self._callbacks):
             try:
-                callback()
-            except Exception as e:
-                print(f"Error in callback: {e}")
+                callback(event)
+            except Exception:
+                logger.exception("Error in callback")
+        return False  # One-shot idle callback
+    
+    def _pending_entry(self, event: Event) -> Optional[Tuple[float, str]]:
+        """Get the reminder heap entry for an event, if it still needs one."""
+        if not event.notify or event.notified:
+            return None
+        notify_ts = event.get_notify_timestamp()
+        if notify_ts is None:
+            return None
+        return (notify_ts, event.id)
+    
+    def _push_pending(self, event: Event):
+        """Queue an event's reminder and re-time the notification check."""
+        entry = self._pending_entry(event)
+        if entry is not None:
+            heapq.heappush(self._pending, entry)
+            self._schedule_notification_check()
     
     def _start_notification_checker(self):
-        """Start the periodic notification checker."""
-        # Check every 30 seconds
-        self._notification_timeout_id = GLib.timeout_add_seconds(30, self._check_notifications)
-        # Also check immediately
-        GLib.idle_add(self._check_notifications)
+        """Start the notification checker."""
+        # Check immediately; each check schedules the next one
+        self._notification_timeout_id = GLib.idle_add(self._check_notifications)
+    
+    def _schedule_notification_check(self):
+        """Wake up when the earliest pending reminder is due, if there is one."""
+        if self._notification_timeout_id:
+            GLib.source_remove(self._notification_timeout_id)
+            self._notification_timeout_id = None
+        
+        if self._pending:
+            wake_ts = self._pending[0][0]
+        elif self._notified_ids:
+            # Only the daily reset of notified flags is left to do
+            tomorrow = date.today() + timedelta(days=1)
+            wake_ts = datetime(tomorrow.year, tomorrow.month, tomorrow.day).timestamp()
+        else:
+            # Nothing to wait for; adding or editing an event reschedules
+            return
+        
+        # Round up, so we don't wake just before the reminder is due
+        delay_ms = int((wake_ts - time.time()) * 1000) + 1
+        delay_ms = min(max(0, delay_ms), _MAX_CHECK_SECONDS * 1000)
+        self._notification_timeout_id = GLib.timeout_add(delay_ms, self._check_notifications)
     
     def _check_notifications(self) -> bool:
         """Check for events that need notifications."""
-        now = datetime.now()
-        today = now.strftime("%Y-%m-%d")
+        # This source ends when we return; don't remove it while rescheduling
+        self._notification_timeout_id = None
+        self._ensure_loaded()
         
-        for event in self.events:
-            if not event.notify or event.notified:
-                continue
+        today = date.today()
+        now_ts = time.time()
+        
+        while self._pending and self._pending[0][0] <= now_ts:
+            notify_ts, event_id = heapq.heappop(self._pending)
             
-            event_dt = event.get_datetime()
-            if event_dt is None:
+            # Entries are not removed on edits, so skip outdated ones
+            event = self._by_id.get(event_id)
+            if event is None or self._pending_entry(event) != (notify_ts, event_id):
                 continue
             
-            # Calculate when to notify
-            notify_time = event_dt - timedelta(minutes=event.notify_minutes_before)
-            
-            # Check if it's time to notify
-            if now >= notify_time and now <= event_dt + timedelta(hours=1):
+            # Check if it's still time to notify
+            if now_ts <= event.get_event_end_timestamp():
                 self._send_notification(event)
                 event.notified = True
-                self.save_events()
+                self._notified_ids.add(event.id)
+                self._log_change("update", event)
         
-        # Reset notified flag for past events (next day)
-        yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-        for event in self.events:
-            if event.date < today and event.notified:
-                event.notified = False
+        # Reset notified flag for past events (next day); only dates that
+        # just passed can qualify, so this runs once per day
+        if today != self._last_tick_date:
+            self._last_tick_date = today
+            for event_id in list(self._notified_ids):
+                event = self._by_id.get(event_id)
+                if event is None or not event.notified:
+                    self._notified_ids.discard(event_id)
+                elif event.day is not None and event.day < today:
+                    event.notified = False
+                    self._notified_ids.discard(event_id)
         
-        return True  # Continue the timeout
+        self._schedule_notification_check()
+        return False  # Replaced by the timeout scheduled above
     
     def _send_notification(self, event: Event):
         """Send a desktop notification for an event."""
@@ -240,11 +734,14 @@ class EventManager:
             app = Gio.Application.get_default()
             if app:
                 app.send_notification(f"event-{event.id}", notification)
-        except Exception as e:
-            print(f"Error sending notification: {e}")
+        except Exception:
+            logger.exception("Error sending notification")
     
     def cleanup(self):
         """Clean up resources."""
         if self._notification_timeout_id:
             GLib.source_remove(self._notification_timeout_id)
             self._notification_timeout_id = None
+        if self._save_timeout_id:
+            GLib.source_remove(self._save_timeout_id)
+        self._flush()
@@ -22,18 +22,8 @@ from datetime import datetime
 from .event_manager import EventManager
 from .event_dialog import EventListDialog, AddEventDialog, AllEventsDialog
 
-# CSS for styling calendar marked days
-CALENDAR_CSS = """
-/* Try border-bottom approach for marked calendar days */
-calendar > grid > label.day-number[data-marked="true"],
-calendar day:checked label,
-calendar label.day:checked,
-.day-number:backdrop:marked,
-calendar.view grid label:marked {
-    border-bottom: 2px solid @accent_color;
-    font-weight: bold;
-}
-"""
+# Provider for calendar.css, shared by all windows
+_css_provider = None
 
 
 @Gtk.Template(resource_path='/com/ml4w/calendar/window.ui')
@@ -70,19 +60,26 @@ class DotfilesCalendarWindow(Adw.ApplicationWindow):
         gesture.connect("released", self._on_calendar_click)
         self.calendar.add_controller(gesture)
         
+        # (year, month, event revision) the calendar marks were last set for
+        self._marks_key = None
+        self._marks_pending = False
+        
         # Register for event updates
         self.event_manager.register_callback(self._update_calendar_marks)
         
         # Initial mark update
-        GLib.idle_add(self._update_calendar_marks)
+        self._queue_calendar_marks()
     
     def _load_css(self):
-        """Load custom CSS for calendar styling."""
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_string(CALENDAR_CSS)
+        """Load custom CSS for calendar styling, once per process."""
+        global _css_provider
+        if _css_provider is not None:
+            return
+        _css_provider = Gtk.CssProvider()
+        _css_provider.load_from_resource('/com/ml4w/calendar/calendar.css')
         Gtk.StyleContext.add_provider_for_display(
             Gdk.Display.get_default(),
-            css_provider,
+            _css_provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
     
@@ -112,35 +109,35 @@ class DotfilesCalendarWindow(Adw.ApplicationWindow):
     
     def _on_month_changed(self, calendar):
         """Handle month/year change - update marks."""
+        self._queue_calendar_marks()
+    
+    def _queue_calendar_marks(self):
+        """Update the calendar marks once the main loop is idle."""
+        if self._marks_pending:
+            return
+        self._marks_pending = True
         GLib.idle_add(self._update_calendar_marks)
     
-    def _update_calendar_marks(self):
+    def _update_calendar_marks(self, changed=None):
         """Update calendar to mark dates with events and update indicator."""
-        # Clear all marks first
-        self.calendar.clear_marks()
+        self._marks_pending = False
         
         # Get current displayed month/year
         date = self.calendar.get_date()
         current_year = date.get_year()
         current_month = date.get_month()
         
-        # Get all dates with events
-        dates_with_events = self.event_manager.get_dates_with_events()
+        # Nothing to do if neither the month nor the events changed
+        marks_key = (current_year, current_month, self.event_manager.revision)
+        if marks_key == self._marks_key:
+            return False
+        self._marks_key = marks_key
+        
+        self.calendar.clear_marks()
         
-        # Find days in the current month that have events
-        days_with_events = []
-        for date_str in dates_with_events:
-            try:
-                parts = date_str.split("-")
-                year = int(parts[0])
-                month = int(parts[1])
-                day = int(parts[2])
-                
-                if year == current_year and month == current_month:
-                    self.calendar.mark_day(day)
-                    days_with_events.append(day)
-            except (ValueError, IndexError):
-                pass
+        # Mark days in the current month that have events
+        for day in self.event_manager.get_days_for_month(current_year, current_month):
+            self.calendar.mark_day(day)
         return False  # Don't repeat
     
     def show_events_for_selected_date(self):